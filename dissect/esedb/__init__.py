@@ -9,7 +9,6 @@ from dissect.esedb.exceptions import (
 __all__ = [
     "EseDB",
     "Error",
-    "CompressedTaggedDataError",
     "InvalidDatabase",
     "KeyNotFoundError",
     "NoNeighbourPageError",
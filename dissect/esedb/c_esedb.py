@@ -1,8 +1,8 @@
+import codecs
 import datetime
 import struct
-import uuid
 from collections import namedtuple
-from typing import Union
+from typing import Callable, Union
 
 from dissect.cstruct import cstruct
 
@@ -444,22 +444,66 @@ TAGFLD_HEADER = c_esedb.TAGFLD_HEADER
 CODEPAGE = c_esedb.CODEPAGE
 COMPRESSION_SCHEME = c_esedb.COMPRESSION_SCHEME
 
+# Bitwise operations on the cstruct flag types are implemented in Python, which makes them relatively slow
+# Flags that are tested for every page, node or value are also available as plain integers
+PAGE_FLAG_ROOT = PAGE_FLAG.Root.value
+PAGE_FLAG_LEAF = PAGE_FLAG.Leaf.value
+PAGE_FLAG_PARENT_OF_LEAF = PAGE_FLAG.ParentOfLeaf.value
+PAGE_FLAG_EMPTY = PAGE_FLAG.Empty.value
+PAGE_FLAG_SPACE_TREE = PAGE_FLAG.SpaceTree.value
+PAGE_FLAG_INDEX = PAGE_FLAG.Index.value
+PAGE_FLAG_LONG_VALUE = PAGE_FLAG.LongValue.value
+PAGE_FLAG_NEW_RECORD_FORMAT = PAGE_FLAG.NewRecordFormat.value
+TAG_FLAG_COMPRESSED = TAG_FLAG.Compressed.value
+TAGFLD_HEADER_COMPRESSED = TAGFLD_HEADER.Compressed.value
+TAGFLD_HEADER_SEPARATED = TAGFLD_HEADER.Separated.value
+TAGFLD_HEADER_MULTI_VALUES = TAGFLD_HEADER.MultiValues.value
+TAGFLD_HEADER_TWO_VALUES = TAGFLD_HEADER.TwoValues.value
+TAGFLD_HEADER_NULL = TAGFLD_HEADER.Null.value
+
 CODEPAGE_MAP = {
     CODEPAGE.UNICODE: "utf-16-le",
     CODEPAGE.WESTERN: "cp1252",
     CODEPAGE.ASCII: "ascii",
 }
+# Keyed by the plain integer codepage
+_CODEPAGE_DECODERS = {encoding.value: codecs.getdecoder(name) for encoding, name in CODEPAGE_MAP.items()}
+_CODEPAGE_UNICODE = CODEPAGE.UNICODE.value
 
 RecordValue = Union[int, float, str, bytes, datetime.datetime, None]
 
 
+def _struct_decoder(fmt: str) -> Callable[[bytes], Union[int, float]]:
+    """Create a decode function that unpacks a single value using a precompiled :class:`struct.Struct`.
+
+    Args:
+        fmt: The struct format of the value.
+    """
+    unpack_from = struct.Struct(fmt).unpack_from
+
+    def decode(buf: bytes) -> Union[int, float]:
+        return unpack_from(buf)[0]
+
+    return decode
+
+
+decode_uint8 = _struct_decoder("<B")
+decode_int16 = _struct_decoder("<h")
+decode_uint16 = _struct_decoder("<H")
+decode_int32 = _struct_decoder("<i")
+decode_uint32 = _struct_decoder("<I")
+decode_int64 = _struct_decoder("<q")
+decode_float = _struct_decoder("<f")
+decode_double = _struct_decoder("<d")
+
+
 def decode_bit(buf: bytes) -> bool:
     """Decode a bit into a boolean.
 
     Args:
         buf: The buffer to decode from.
     """
-    return c_esedb.uint8(buf) == 0xFF
+    return buf[0] == 0xFF
 
 
 def decode_text(buf: bytes, encoding: CODEPAGE) -> str:
@@ -468,12 +512,15 @@ def decode_text(buf: bytes, encoding: CODEPAGE) -> str:
     Args:
         buf: The buffer to decode from.
     """
-    buf = bytes(buf)
+    codepage = int(encoding)
+    if codepage == _CODEPAGE_UNICODE and len(buf) % 2:
+        buf = bytes(buf) + b"\x00"
 
-    if encoding == CODEPAGE.UNICODE and len(buf) % 2:
-        buf += b"\x00"
+    # The decoders accept any buffer, so there's no need to copy the buffer to bytes first
+    return _CODEPAGE_DECODERS[codepage](buf)[0].rstrip("\x00")
 
-    return buf.decode(CODEPAGE_MAP[encoding]).rstrip("\x00")
+
+_unpack_guid = struct.Struct("<IHH8s").unpack_from
 
 
 def decode_guid(buf: bytes) -> str:
@@ -482,15 +529,31 @@ def decode_guid(buf: bytes) -> str:
     Args:
         buf: The buffer to decode from.
     """
-    return str(uuid.UUID(bytes_le=bytes(buf)))
+    # Format the GUID directly instead of going through a UUID object
+    data1, data2, data3, data4 = _unpack_guid(buf)
+    return f"{data1:08x}-{data2:04x}-{data3:04x}-{data4[:2].hex()}-{data4[2:].hex()}"
 
 
 def checksum_xor(data: bytes, initial: int = 0x89ABCDEF) -> int:
-    digest = initial
-    for val in struct.unpack(f"<{len(data) // 4}I", data):
-        digest ^= val
+    """Calculate the XOR checksum of the given data, as 32-bit little endian integers.
+
+    Instead of unpacking and XOR'ing every integer separately, the data is interpreted as one large integer that is
+    repeatedly folded in half by XOR'ing the upper half onto the lower half, until a single 32-bit value remains.
+
+    Args:
+        data: The data to calculate the checksum of. Trailing bytes that don't form a full integer are ignored.
+        initial: The initial checksum value.
+    """
+    count = len(data) // 4
+    value = int.from_bytes(data[: count * 4], "little")
+
+    while count > 1:
+        half = count // 2
+        bits = half * 32
+        value = (value >> bits) ^ (value & ((1 << bits) - 1))
+        count -= half
 
-    return digest
+    return initial ^ value
 
 
 ColumnType = namedtuple("ColumnType", ["value", "name", "size", "parse"])
@@ -498,24 +561,24 @@ ColumnType = namedtuple("ColumnType", ["value", "name", "size", "parse"])
 COLUMN_TYPES = [
     ColumnType(JET_coltyp.Nil, "NULL", 0, None),
     ColumnType(JET_coltyp.Bit, "Boolean", 1, decode_bit),
-    ColumnType(JET_coltyp.UnsignedByte, "Unsigned byte", 1, c_esedb.uint8),
-    ColumnType(JET_coltyp.Short, "Signed short", 2, c_esedb.int16),
-    ColumnType(JET_coltyp.Long, "Signed long", 4, c_esedb.int32),
-    ColumnType(JET_coltyp.Currency, "Currency", 8, c_esedb.int64),
-    ColumnType(JET_coltyp.IEEESingle, "Single precision FP", 4, c_esedb.float),
-    ColumnType(JET_coltyp.IEEEDouble, "Double precision FP", 8, c_esedb.double),
+    ColumnType(JET_coltyp.UnsignedByte, "Unsigned byte", 1, decode_uint8),
+    ColumnType(JET_coltyp.Short, "Signed short", 2, decode_int16),
+    ColumnType(JET_coltyp.Long, "Signed long", 4, decode_int32),
+    ColumnType(JET_coltyp.Currency, "Currency", 8, decode_int64),
+    ColumnType(JET_coltyp.IEEESingle, "Single precision FP", 4, decode_float),
+    ColumnType(JET_coltyp.IEEEDouble, "Double precision FP", 8, decode_double),
     # Parse DateTime as an int64 because the actual parsing of the value can differ between databases
     # E.g. by default it's supposed to be an OA date, but the UAL stores it as a regular Windows timestamp
-    ColumnType(JET_coltyp.DateTime, "DateTime", 8, c_esedb.int64),
+    ColumnType(JET_coltyp.DateTime, "DateTime", 8, decode_int64),
     ColumnType(JET_coltyp.Binary, "Binary", None, bytes),
     ColumnType(JET_coltyp.Text, "Text", None, decode_text),
     ColumnType(JET_coltyp.LongBinary, "Long Binary", None, bytes),
     ColumnType(JET_coltyp.LongText, "Long Text", None, decode_text),
     ColumnType(JET_coltyp.SLV, "Super Long Value", None, None),
-    ColumnType(JET_coltyp.UnsignedLong, "Unsigned long", 4, c_esedb.uint32),
-    ColumnType(JET_coltyp.LongLong, "Signed Long long", 8, c_esedb.int64),
+    ColumnType(JET_coltyp.UnsignedLong, "Unsigned long", 4, decode_uint32),
+    ColumnType(JET_coltyp.LongLong, "Signed Long long", 8, decode_int64),
     ColumnType(JET_coltyp.GUID, "GUID", 16, decode_guid),
-    ColumnType(JET_coltyp.UnsignedShort, "Unsigned short", 2, c_esedb.uint16),
+    ColumnType(JET_coltyp.UnsignedShort, "Unsigned short", 2, decode_uint16),
     ColumnType(JET_coltyp.Max, "Max", None, None),
 ]
 COLUMN_TYPE_MAP = {t.value.value: t for t in COLUMN_TYPES}
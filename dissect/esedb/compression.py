@@ -1,10 +1,12 @@
 import struct
-from typing import Optional
+from typing import Callable, Optional
 
 from dissect.util.compression import lzxpress, sevenbit
 
 from dissect.esedb.c_esedb import COMPRESSION_SCHEME
 
+_unpack_xpress_size = struct.Struct("<H").unpack_from
+
 
 def decompress(buf: bytes) -> bytes:
     """Decompress the given bytes according to the encoded compression scheme.
@@ -15,18 +17,16 @@ def decompress(buf: bytes) -> bytes:
     Raises:
         NotImplementedError: If the buffer is compressed with an unsupported compression algorithm (XPRESS9/XPRESS10).
     """
-    identifier = buf[0] >> 3
-    if identifier == COMPRESSION_SCHEME.COMPRESS_7BITASCII:
-        return sevenbit.decompress(buf[1:])
-    elif identifier == COMPRESSION_SCHEME.COMPRESS_7BITUNICODE:
-        return sevenbit.decompress(buf[1:], wide=True)
-    elif identifier == COMPRESSION_SCHEME.COMPRESS_XPRESS:
-        return lzxpress.decompress(buf[3:])
-    elif identifier in (COMPRESSION_SCHEME.COMPRESS_XPRESS9, COMPRESSION_SCHEME.COMPRESS_XPRESS10):
-        raise NotImplementedError(f"Compression not yet implemented: {COMPRESSION_SCHEME(identifier)}")
-    else:
+    header = buf[0]
+    if header < 0x08:
+        # Fast path for the most common case, a compression scheme identifier of 0 (not compressed)
+        return buf
+
+    decompress_func = _DECOMPRESS_FUNCS[header >> 3]
+    if decompress_func is None:
         # Not compressed
         return buf
+    return decompress_func(buf)
 
 
 def decompress_size(buf: bytes) -> Optional[int]:
@@ -38,13 +38,58 @@ def decompress_size(buf: bytes) -> Optional[int]:
     Raises:
         NotImplementedError: If the buffer is compressed with an unsupported compression algorithm (XPRESS9/XPRESS10).
     """
-    identifier = buf[0] >> 3
-    if identifier == COMPRESSION_SCHEME.COMPRESS_7BITASCII:
-        return ((buf[0] & 7) + (8 * len(buf))) // 7
-    elif identifier == COMPRESSION_SCHEME.COMPRESS_7BITUNICODE:
-        return 2 * (((buf[0] & 7) + (8 * len(buf))) // 7)
-    elif identifier == COMPRESSION_SCHEME.COMPRESS_XPRESS:
-        return struct.unpack("<H", buf[1:2])[0]
-    elif identifier in (COMPRESSION_SCHEME.COMPRESS_XPRESS9, COMPRESSION_SCHEME.COMPRESS_XPRESS10):
-        raise NotImplementedError(f"Compression not yet implemented: {COMPRESSION_SCHEME(identifier)}")
-    return None
+    header = buf[0]
+    if header < 0x08:
+        # Not compressed
+        return None
+
+    size_func = _DECOMPRESS_SIZE_FUNCS[header >> 3]
+    if size_func is None:
+        return None
+    return size_func(buf)
+
+
+def _decompress_7bitascii(buf: bytes) -> bytes:
+    return sevenbit.decompress(buf[1:])
+
+
+def _decompress_7bitunicode(buf: bytes) -> bytes:
+    return sevenbit.decompress(buf[1:], wide=True)
+
+
+def _decompress_xpress(buf: bytes) -> bytes:
+    return lzxpress.decompress(buf[3:])
+
+
+def _decompress_size_7bitascii(buf: bytes) -> int:
+    return ((buf[0] & 7) + (8 * len(buf))) // 7
+
+
+def _decompress_size_7bitunicode(buf: bytes) -> int:
+    return 2 * (((buf[0] & 7) + (8 * len(buf))) // 7)
+
+
+def _decompress_size_xpress(buf: bytes) -> int:
+    # The decompressed size is stored as an USHORT right after the header byte
+    return _unpack_xpress_size(buf, 1)[0]
+
+
+def _not_implemented(buf: bytes) -> None:
+    raise NotImplementedError(f"Compression not yet implemented: {COMPRESSION_SCHEME(buf[0] >> 3)}")
+
+
+# Lookup tables for the compression scheme identifier (the 5 MSB of the first byte)
+# Identifiers without an entry are not compressed
+_DECOMPRESS_FUNCS: list[Optional[Callable[[bytes], bytes]]] = [None] * 32
+_DECOMPRESS_FUNCS[COMPRESSION_SCHEME.COMPRESS_7BITASCII] = _decompress_7bitascii
+_DECOMPRESS_FUNCS[COMPRESSION_SCHEME.COMPRESS_7BITUNICODE] = _decompress_7bitunicode
+_DECOMPRESS_FUNCS[COMPRESSION_SCHEME.COMPRESS_XPRESS] = _decompress_xpress
+_DECOMPRESS_FUNCS[COMPRESSION_SCHEME.COMPRESS_XPRESS9] = _not_implemented
+_DECOMPRESS_FUNCS[COMPRESSION_SCHEME.COMPRESS_XPRESS10] = _not_implemented
+
+_DECOMPRESS_SIZE_FUNCS: list[Optional[Callable[[bytes], int]]] = [None] * 32
+_DECOMPRESS_SIZE_FUNCS[COMPRESSION_SCHEME.COMPRESS_7BITASCII] = _decompress_size_7bitascii
+_DECOMPRESS_SIZE_FUNCS[COMPRESSION_SCHEME.COMPRESS_7BITUNICODE] = _decompress_size_7bitunicode
+_DECOMPRESS_SIZE_FUNCS[COMPRESSION_SCHEME.COMPRESS_XPRESS] = _decompress_size_xpress
+_DECOMPRESS_SIZE_FUNCS[COMPRESSION_SCHEME.COMPRESS_XPRESS9] = _not_implemented
+_DECOMPRESS_SIZE_FUNCS[COMPRESSION_SCHEME.COMPRESS_XPRESS10] = _not_implemented
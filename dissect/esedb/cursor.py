@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Union
+from bisect import bisect_left, bisect_right
+from typing import TYPE_CHECKING, Iterator, Union
 
 from dissect.esedb.exceptions import KeyNotFoundError, NoNeighbourPageError
 from dissect.esedb.page import Node, Page
@@ -39,12 +40,14 @@ class Cursor:
 
         Can move the cursor to the next page as a side effect.
         """
-        if self._node_num + 1 > self._page.node_count - 1:
-            self.next_page()
-        else:
-            self._node_num += 1
+        node_num = self._node_num + 1
+        page = self._page
+        if node_num < page.node_count:
+            self._node_num = node_num
+            return page.node(node_num)
 
-        return self.node()
+        self.next_page()
+        return self._page.node(0)
 
     def next_page(self) -> None:
         """Move the cursor to the next page in the tree.
@@ -52,23 +55,25 @@ class Cursor:
         Raises:
             NoNeighbourPageError: If the current page has no next page.
         """
-        if self._page.next_page:
-            self._page = self.esedb.page(self._page.next_page)
-            self._node_num = 0
-        else:
+        next_page = self._page.next_page
+        if not next_page:
             raise NoNeighbourPageError(f"{self._page} has no next page")
 
+        self._page = self.esedb.page(next_page)
+        self._node_num = 0
+
     def prev(self) -> Node:
         """Move the cursor to the previous node and return it.
 
         Can move the cursor to the previous page as a side effect.
         """
-        if self._node_num - 1 < 0:
-            self.prev_page()
-        else:
-            self._node_num -= 1
+        node_num = self._node_num - 1
+        if node_num >= 0:
+            self._node_num = node_num
+            return self._page.node(node_num)
 
-        return self.node()
+        self.prev_page()
+        return self._page.node(self._node_num)
 
     def prev_page(self) -> None:
         """Move the cursor to the previous page in the tree.
@@ -76,12 +81,14 @@ class Cursor:
         Raises:
             NoNeighbourPageError: If the current page has no previous page.
         """
-        if self._page.previous_page:
-            self._page = self.esedb.page(self._page.previous_page)
-            self._node_num = self._page.node_count - 1
-        else:
+        previous_page = self._page.previous_page
+        if not previous_page:
             raise NoNeighbourPageError(f"{self._page} has no previous page")
 
+        page = self.esedb.page(previous_page)
+        self._page = page
+        self._node_num = page.node_count - 1
+
     def search(self, key: bytes, exact: bool = True) -> Node:
         """Search the tree for the given key.
 
@@ -94,22 +101,51 @@ class Cursor:
         Raises:
             KeyNotFoundError: If an ``exact`` match was requested but not found.
         """
-        page = self._page
-        while True:
-            node = find_node(page, key)
-
-            if page.is_branch:
-                page = self.esedb.page(node.child)
-            else:
-                self._page = page
-                self._page_num = page.num
-                self._node_num = node.num
-                break
+        node = self._find(key)
+
+        self._page = node.tag.page
+        self._page_num = self._page.num
+        self._node_num = node.num
 
         if exact and key != node.key:
             raise KeyNotFoundError(f"Can't find key: {key}")
 
-        return self.node()
+        return node
+
+    def scan_from(self, key: bytes) -> Iterator[Node]:
+        """Search the tree for the given key and yield all nodes from there on.
+
+        Starts with the matching node, or the node the search ends on if there's no exact match, and continues
+        over the next pages until the end of the tree. The position of the cursor is not changed.
+
+        Args:
+            key: The key to start scanning from.
+        """
+        get_page = self.esedb.page
+
+        node = self._find(key)
+        page = node.tag.page
+        node_idx = node.num
+
+        while True:
+            for idx in range(node_idx, page.node_count):
+                yield page.node(idx)
+
+            if not page.next_page:
+                break
+
+            page = get_page(page.next_page)
+            node_idx = 0
+
+    def _find(self, key: bytes) -> Node:
+        """Search the tree for the given key, starting from the current page, without moving the cursor."""
+        get_page = self.esedb.page
+
+        page = self._page
+        while page.is_branch:
+            page = get_page(find_node(page, key).child)
+
+        return find_node(page, key)
 
 
 def find_node(page: Page, key: bytes) -> Node:
@@ -119,28 +155,18 @@ def find_node(page: Page, key: bytes) -> Node:
         page: The page to start searching from. Should be a branch page.
         key: The key to search.
     """
-    first_node_idx = 0
-    last_node_idx = page.node_count - 1
-
-    node = None
-    while first_node_idx < last_node_idx:
-        node_idx = (first_node_idx + last_node_idx) // 2
-        node = page.node(node_idx)
-
-        # It turns out that the way BTree keys are compared matches 1:1 with how Python compares bytes
-        # First compare data, then length
-        if key < node.key:
-            last_node_idx = node_idx
-        elif key == node.key:
-            if page.is_branch:
-                # If there's an exact match on a key on a branch page, the actual leaf nodes are in the next branch
-                # Page keys for branch pages appear to be non-inclusive upper bounds
-                node_idx = min(node_idx + 1, page.node_count - 1)
-                node = page.node(node_idx)
-
-            return node
-        else:
-            first_node_idx = node_idx + 1
-
-    # We're at the last node
-    return page.node(first_node_idx)
+    # The key of the last node is never compared, it acts as the upper bound of the page
+    # It turns out that the way BTree keys are compared matches 1:1 with how Python compares bytes
+    # First compare data, then length
+    keys = page.keys
+    last_node_idx = len(keys) - 1
+
+    if page.is_branch:
+        # Page keys for branch pages appear to be non-inclusive upper bounds
+        # If there's an exact match on a key on a branch page, the actual leaf nodes are in the next branch
+        node_idx = bisect_right(keys, key, 0, last_node_idx)
+    else:
+        # Find the first node that is greater than or equal to the search key
+        node_idx = bisect_left(keys, key, 0, last_node_idx)
+
+    return page.node(node_idx)
@@ -2,6 +2,8 @@
 # Combination of pre-source release reverse engineering and post-source release cleanup
 # Reference: https://github.com/microsoft/Extensible-Storage-Engine
 
+import io
+import os
 from functools import cached_property, lru_cache
 from typing import BinaryIO, Iterator
 
@@ -43,10 +45,11 @@ class EseDB:
         if self.format_major < 9:
             raise InvalidDatabase("unsupported format revision")
 
-        self.catalog = Catalog(self, pgnoFDPMSO)
-
+        self._pread = _can_pread(fh)
         self.page = lru_cache(4096)(self.page)
 
+        self.catalog = Catalog(self, pgnoFDPMSO)
+
     @cached_property
     def has_small_pages(self) -> bool:
         """Return whether this database has small pages (<= 8K)."""
@@ -76,8 +79,13 @@ class EseDB:
         if num < 1:
             raise IndexError("page number cannot be less than 1")
 
-        self.fh.seek((num - 1) * self.page_size)
-        buf = self.fh.read(self.page_size)
+        offset = (num - 1) * self.page_size
+        if self._pread:
+            # Read at the offset directly, without moving the file position of the file-like object
+            buf = os.pread(self.fh.fileno(), self.page_size, offset)
+        else:
+            self.fh.seek(offset)
+            buf = self.fh.read(self.page_size)
 
         if len(buf) != self.page_size:
             raise IndexError("page number exceeds file size")
@@ -93,15 +101,34 @@ class EseDB:
         Args:
             num: The logical page number to retrieve.
         """
-        buf = self.read_page(num + 2)
-        return Page(self, num, buf)
+        return self._page(num)
 
     def pages(self) -> Iterator[Page]:
-        """Iterate over all pages."""
+        """Iterate over all pages.
+
+        Pages are parsed without going through the page cache, so a full sweep doesn't evict the pages that are
+        used for searching the trees.
+        """
         num = 1
         while True:
             try:
-                yield self.page(num)
-                num += 1
+                page = self._page(num)
             except IndexError:
                 break
+
+            yield page
+            num += 1
+
+    def _page(self, num: int) -> Page:
+        """Read and parse a logical page, without caching it."""
+        buf = self.read_page(num + 2)
+        return Page(self, num, buf)
+
+
+def _can_pread(fh: BinaryIO) -> bool:
+    """Return whether pages can be read from the given file-like object with ``os.pread``.
+
+    Only plain file objects are considered. Other file-like objects, such as decompression streams, may still expose
+    the file descriptor of an underlying file. ``os.pread`` is also not available on every platform.
+    """
+    return hasattr(os, "pread") and isinstance(getattr(fh, "raw", fh), io.FileIO)
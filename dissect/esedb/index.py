@@ -17,6 +17,17 @@ if TYPE_CHECKING:
 
 JET_cbKeyMost_OLD = 255
 
+_iter_unpack_key_field_ids = struct.Struct("<HH").iter_unpack
+_pack_uint16_be = struct.Struct(">H").pack
+_pack_uint32_be = struct.Struct(">I").pack
+_pack_uint64_be = struct.Struct(">Q").pack
+_pack_float = struct.Struct("<f").pack
+_pack_double = struct.Struct("<d").pack
+_unpack_uint32 = struct.Struct("<I").unpack
+_unpack_uint64 = struct.Struct("<Q").unpack
+_unpack_guid = struct.Struct("<IHH2s6s").unpack
+_pack_guid_key = struct.Struct("<6s2sHHI").pack
+
 
 class Index(object):
     """Represents an index on a table.
@@ -47,13 +58,20 @@ class Index(object):
     @cached_property
     def column_ids(self) -> list[int]:
         """Return a list of column IDs that are used in this index."""
-        column_ids = []
         key_field_ids = self.record.get("KeyFldIDs")
-        if len(key_field_ids) % 4 == 0:
-            for i in range(0, len(key_field_ids), 4):
-                _, column_identifier = struct.unpack("<HH", key_field_ids[i : i + 4])
-                column_ids.append(column_identifier)
-        return column_ids
+        if len(key_field_ids) % 4 != 0:
+            return []
+        return [column_identifier for _, column_identifier in _iter_unpack_key_field_ids(key_field_ids)]
+
+    @cached_property
+    def lcmap_flags(self) -> int:
+        """Return the ``LCMapStringEx`` flags that are used to generate keys for Unicode text columns."""
+        return self.record.get("LCMapFlags")
+
+    @cached_property
+    def locale(self) -> str:
+        """Return the locale that is used to generate keys for Unicode text columns."""
+        return self.record.get("LocaleName").decode("utf-16-le")
 
     @cached_property
     def columns(self) -> list[Column]:
@@ -136,54 +154,17 @@ def encode_key(index: Index, column: Column, value: RecordValue, max_size: int)
 
     # All keys with data are prefixed with 0x7f (bPrefixData)
     # There are other prefixes but we don't support those yet
-    key = bytearray([bPrefixData])
-
-    if column.type == JET_coltyp.Bit:
-        key.append(0xFF if value else 0x00)
-
-    elif column.type == JET_coltyp.UnsignedByte:
-        key.append(value)
-
-    elif column.type == JET_coltyp.Short:
-        # Signed integers have their MSB bit flipped
-        key += struct.pack(">H", (value ^ (1 << 15)) & 0xFFFF)
-
-    elif column.type == JET_coltyp.Long:
-        key += struct.pack(">I", (value ^ (1 << 31)) & 0xFFFFFFFF)
-
-    elif column.type in (JET_coltyp.Currency, JET_coltyp.LongLong):
-        key += struct.pack(">Q", (value ^ (1 << 63)) & 0xFFFFFFFFFFFFFFFF)
-
-    elif column.type == JET_coltyp.IEEESingle:
-        value = struct.unpack("<I", struct.pack("<f", value))[0]
-
-        value = _flip_bits(value, 32)
-        key += struct.pack(">I", value)
-
-    elif column.type in (JET_coltyp.IEEEDouble, JET_coltyp.DateTime):
-        if column.type == JET_coltyp.IEEEDouble:
-            value = struct.unpack("<Q", struct.pack("<d", value))[0]
-
-        value = _flip_bits(value, 64)
-        key += struct.pack(">Q", value)
-
+    encode = _KEY_ENCODERS.get(column.type.value)
+    if encode is not None:
+        key = encode(value)
     elif column.is_binary:
-        key += _encode_binary(column, value, max_size)
-
+        key = _encode_binary(column, value, max_size)
     elif column.is_text:
-        key += _encode_text(index, column, value, max_size)
-
-    elif column.type == JET_coltyp.UnsignedLong:
-        # Unsigned variants are added as is
-        key += struct.pack(">I", value)
-
-    elif column.type == JET_coltyp.GUID:
-        key += _encode_guid(value)
-
-    elif column.type == JET_coltyp.UnsignedShort:
-        key += struct.pack(">H", value)
+        key = _encode_text(index, column, value, max_size)
+    else:
+        key = b""
 
-    return bytes(key)
+    return bytes([bPrefixData]) + key
 
 
 def _encode_binary(column: Column, value: bytes, max_size: int) -> bytes:
@@ -258,9 +239,7 @@ def _encode_text(index: Index, column: Column, value: str, max_size: int) -> byt
         key.append(0)
     else:
         # Unicode strings == LCMapStringW
-        flags = index.record.get("LCMapFlags")
-        locale = index.record.get("LocaleName").decode("utf-16-le")
-        segment = map_string(value, flags, locale)
+        segment = map_string(value, index.lcmap_flags, index.locale)
         key += segment[:max_size]
 
     return bytes(key)
@@ -269,15 +248,66 @@ def _encode_text(index: Index, column: Column, value: str, max_size: int) -> byt
 def _encode_guid(value: Union[str, uuid.UUID]) -> bytes:
     if isinstance(value, str):
         value = uuid.UUID(value)
-    guid_bytes = value.bytes_le
 
-    return guid_bytes[-6:] + guid_bytes[-8:-6] + guid_bytes[-10:-8] + guid_bytes[-12:-10] + guid_bytes[:-12]
+    # The fields of the little endian GUID are stored in reverse order, with the last 8 bytes split into 2 and 6
+    data1, data2, data3, data4_1, data4_2 = _unpack_guid(value.bytes_le)
+    return _pack_guid_key(data4_2, data4_1, data3, data2, data1)
 
 
 def _flip_bits(value: int, size: int) -> int:
-    if value & (1 << (size - 1)):
-        # If the high bit is set, all bits are flipped
-        return ~value & ((1 << size) - 1)
-    else:
-        # Otherwise only the high bit is flipped
-        return value ^ (1 << (size - 1))
+    # If the high bit is set, all bits are flipped, otherwise only the high bit is flipped
+    # The mask is all ones if the high bit is set, or only the high bit otherwise
+    high_bit = 1 << (size - 1)
+    mask = -((value >> (size - 1)) & 1) | high_bit
+    return (value ^ mask) & ((1 << size) - 1)
+
+
+def _encode_bit(value: bool) -> bytes:
+    return b"\xff" if value else b"\x00"
+
+
+def _encode_unsigned_byte(value: int) -> bytes:
+    return bytes([value])
+
+
+def _encode_short(value: int) -> bytes:
+    # Signed integers have their MSB bit flipped
+    return _pack_uint16_be((value ^ (1 << 15)) & 0xFFFF)
+
+
+def _encode_long(value: int) -> bytes:
+    return _pack_uint32_be((value ^ (1 << 31)) & 0xFFFFFFFF)
+
+
+def _encode_long_long(value: int) -> bytes:
+    return _pack_uint64_be((value ^ (1 << 63)) & 0xFFFFFFFFFFFFFFFF)
+
+
+def _encode_single(value: float) -> bytes:
+    return _pack_uint32_be(_flip_bits(_unpack_uint32(_pack_float(value))[0], 32))
+
+
+def _encode_double(value: float) -> bytes:
+    return _pack_uint64_be(_flip_bits(_unpack_uint64(_pack_double(value))[0], 64))
+
+
+def _encode_datetime(value: int) -> bytes:
+    return _pack_uint64_be(_flip_bits(value, 64))
+
+
+# Encoders for the fixed size column types, by their plain integer value
+# Unsigned variants are added as is
+_KEY_ENCODERS = {
+    JET_coltyp.Bit.value: _encode_bit,
+    JET_coltyp.UnsignedByte.value: _encode_unsigned_byte,
+    JET_coltyp.Short.value: _encode_short,
+    JET_coltyp.Long.value: _encode_long,
+    JET_coltyp.Currency.value: _encode_long_long,
+    JET_coltyp.LongLong.value: _encode_long_long,
+    JET_coltyp.IEEESingle.value: _encode_single,
+    JET_coltyp.IEEEDouble.value: _encode_double,
+    JET_coltyp.DateTime.value: _encode_datetime,
+    JET_coltyp.UnsignedLong.value: _pack_uint32_be,
+    JET_coltyp.GUID.value: _encode_guid,
+    JET_coltyp.UnsignedShort.value: _pack_uint16_be,
+}
@@ -1,12 +1,9 @@
 # Based on Wine source
 # https://github.com/wine-mirror/wine/blob/master/dlls/kernelbase/locale.c
 
+import struct
 from enum import IntEnum, IntFlag
 
-from dissect.util.xmemoryview import xmemoryview
-
-from dissect.esedb.sorting_table import table
-
 
 class MapFlags(IntFlag):
     NORM_IGNORECASE = 0x00000001  # ignore case
@@ -71,6 +68,10 @@ class SCRIPT(IntEnum):
     CJK_LAST = 239
 
 
+# All scripts from this value on are sorted the same way, which is the most common case
+_SCRIPT_DIGIT = SCRIPT.DIGIT.value
+
+
 class CASE(IntFlag):
     FULLWIDTH = 0x01  # full width kana (vs. half width)
     FULLSIZE = 0x02  # full size kana (vs. small)
@@ -98,9 +99,13 @@ def map_string(value: str, flags: MapFlags, locale: str) -> bytes:
     Raises:
         NotImplementedError: If an unsupported flag or character is encountered.
     """
-    key_primary = []
+    # The sorting table is large, so only import it when it's actually needed
+    from dissect.esedb.sorting_table import table
+
+    key_primary = bytearray()
+    # Stacked nonspacing marks add up their diacritic weights, which can exceed a byte
     key_diacritic = []
-    key_case = []
+    key_case = bytearray()
 
     if not flags & MapFlags.LCMAP_SORTKEY:
         raise NotImplementedError("Only LCMAP_SORTKEY is partially supported")
@@ -113,8 +118,14 @@ def map_string(value: str, flags: MapFlags, locale: str) -> bytes:
     if flags & MapFlags.NORM_IGNOREKANATYPE:
         case_mask &= ~CASE.KATAKANA
 
-    view = xmemoryview(value.encode("utf-16-le"), "<H")
-    for cp in view:
+    # Resolve everything that's needed per character up front
+    case_mask = int(case_mask)
+    ignore_diacritic = bool(flags & MapFlags.LINGUISTIC_IGNOREDIACRITIC)
+    ignore_symbols = bool(flags & MapFlags.NORM_IGNORESYMBOLS)
+    string_sort = bool(flags & MapFlags.SORT_STRINGSORT)
+
+    buf = value.encode("utf-16-le")
+    for cp in struct.unpack(f"<{len(buf) // 2}H", buf):
         weight = table[cp]
 
         alphabetic_weight = weight >> 24
@@ -122,11 +133,19 @@ def map_string(value: str, flags: MapFlags, locale: str) -> bytes:
         diacritic_weight = (weight >> 8) & 0xFF
         case_weight = (weight & 0xFF) & case_mask
 
+        if script_member >= _SCRIPT_DIGIT:
+            # Digits, letters and all other scripts are added as is
+            key_primary.append(script_member)
+            key_primary.append(alphabetic_weight)
+            key_diacritic.append(diacritic_weight)
+            key_case.append(case_weight)
+            continue
+
         if script_member == SCRIPT.UNSORTABLE:
             continue
 
         if script_member == SCRIPT.NONSPACE_MARK:
-            if flags & MapFlags.LINGUISTIC_IGNOREDIACRITIC:
+            if ignore_diacritic:
                 diacritic_weight = 2
 
             if len(key_diacritic):
@@ -153,10 +172,10 @@ def map_string(value: str, flags: MapFlags, locale: str) -> bytes:
             continue
 
         if script_member == SCRIPT.PUNCTUATION:
-            if flags & MapFlags.NORM_IGNORESYMBOLS:
+            if ignore_symbols:
                 continue
 
-            if not flags & MapFlags.SORT_STRINGSORT:
+            if not string_sort:
                 raise NotImplementedError(SCRIPT.PUNCTUATION)
 
             key_primary.append(script_member)
@@ -173,7 +192,7 @@ def map_string(value: str, flags: MapFlags, locale: str) -> bytes:
             SCRIPT.SYMBOL_5,
             SCRIPT.SYMBOL_6,
         ):
-            if flags & MapFlags.NORM_IGNORESYMBOLS:
+            if ignore_symbols:
                 continue
             key_primary.append(script_member)
             key_primary.append(alphabetic_weight)
@@ -181,41 +200,26 @@ def map_string(value: str, flags: MapFlags, locale: str) -> bytes:
             key_case.append(case_weight)
             continue
 
-        if script_member == SCRIPT.DIGIT and 0:
-            raise NotImplementedError(SCRIPT.DIGIT)
-
         # else
         key_primary.append(script_member)
         key_primary.append(alphabetic_weight)
         key_diacritic.append(diacritic_weight)
         key_case.append(case_weight)
 
-    key_diacritic = _filter_weights(key_diacritic)
+    if flags & MapFlags.NORM_IGNORENONSPACE:
+        key_diacritic = bytearray()
+    else:
+        key_diacritic = _filter_weights(bytearray(key_diacritic))
+
     if flags & (MapFlags.NORM_IGNORECASE | MapFlags.NORM_IGNOREWIDTH):
-        key_case = []
+        key_case = bytearray()
     else:
         key_case = _filter_weights(key_case)
 
-    return bytes(
-        [
-            *key_primary,
-            0x01,
-            *(key_diacritic if not flags & MapFlags.NORM_IGNORENONSPACE else []),
-            0x01,
-            *key_case,
-            0x01,
-            # extra would go here
-            0x01,
-            # special would go here
-            0x00,
-        ]
-    )
-
-
-def _filter_weights(weights):
-    i = len(weights)
-    while i > 0:
-        if weights[i - 1] > 2:
-            break
-        i -= 1
-    return weights[:i]
+    # Extra and special weights would go between the last separators
+    return b"".join([key_primary, b"\x01", key_diacritic, b"\x01", key_case, b"\x01\x01\x00"])
+
+
+def _filter_weights(weights: bytearray) -> bytearray:
+    # Trailing weights of 2 or lower are dropped
+    return weights.rstrip(b"\x00\x01\x02")
@@ -4,11 +4,26 @@ import struct
 from functools import cached_property
 from typing import TYPE_CHECKING, Iterator, Optional, Union
 
-from dissect.esedb.c_esedb import PAGE_FLAG, TAG_FLAG, c_esedb
+from dissect.esedb.c_esedb import (
+    PAGE_FLAG_EMPTY,
+    PAGE_FLAG_INDEX,
+    PAGE_FLAG_LEAF,
+    PAGE_FLAG_LONG_VALUE,
+    PAGE_FLAG_NEW_RECORD_FORMAT,
+    PAGE_FLAG_PARENT_OF_LEAF,
+    PAGE_FLAG_ROOT,
+    PAGE_FLAG_SPACE_TREE,
+    TAG_FLAG,
+    TAG_FLAG_COMPRESSED,
+    c_esedb,
+)
 
 if TYPE_CHECKING:
     from dissect.esedb.esedb import EseDB
 
+_unpack_uint16 = struct.Struct("<H").unpack_from
+_unpack_uint32 = struct.Struct("<I").unpack_from
+
 
 class Page:
     """Represents a logical page of an ESE database.
@@ -23,6 +38,7 @@ class Page:
         self.esedb = esedb
         self.num = num
         self.buf = memoryview(buf)
+        self.is_small_page = esedb.has_small_pages
 
         data_start = len(c_esedb.PGHDR)
         self.header = c_esedb.PGHDR(self.buf)
@@ -33,6 +49,17 @@ class Page:
             data_start += len(c_esedb.PGHDR2)
 
         self.flags = self.header.fFlags
+        self._flags = flags = self.flags.value
+        self.is_root = bool(flags & PAGE_FLAG_ROOT)
+        self.is_leaf = bool(flags & PAGE_FLAG_LEAF)
+        self.is_parent = bool(flags & PAGE_FLAG_PARENT_OF_LEAF)
+        self.is_empty = bool(flags & PAGE_FLAG_EMPTY)
+        self.is_space_tree = bool(flags & PAGE_FLAG_SPACE_TREE)
+        self.is_index = bool(flags & PAGE_FLAG_INDEX)
+        self.is_long_value = bool(flags & PAGE_FLAG_LONG_VALUE)
+        self.is_new_record_format = bool(flags & PAGE_FLAG_NEW_RECORD_FORMAT)
+        self.is_branch = not self.is_leaf
+
         self.previous_page = self.header.pgnoPrev
         self.next_page = self.header.pgnoNext
 
@@ -42,48 +69,37 @@ class Page:
         self.tag_count = self.header.itagMicFree
         self.node_count = self.tag_count - 1
         self._node_cls = LeafNode if self.is_leaf else BranchNode
-        self._node_cache = {}
-
-    @cached_property
-    def is_small_page(self) -> bool:
-        return self.esedb.has_small_pages
-
-    @cached_property
-    def is_root(self) -> bool:
-        return bool(self.flags & PAGE_FLAG.Root)
-
-    @cached_property
-    def is_leaf(self) -> bool:
-        return bool(self.flags & PAGE_FLAG.Leaf)
-
-    @cached_property
-    def is_parent(self) -> bool:
-        return bool(self.flags & PAGE_FLAG.ParentOfLeaf)
-
-    @cached_property
-    def is_empty(self) -> bool:
-        return bool(self.flags & PAGE_FLAG.Empty)
+        self._node_cache: list[Optional[Node]] = [None] * self.node_count
 
     @cached_property
-    def is_space_tree(self) -> bool:
-        return bool(self.flags & PAGE_FLAG.SpaceTree)
+    def key_prefix(self) -> Optional[bytes]:
+        # The first tag holds the common key prefix of the page, which is only needed for compressed keys
+        if not self.is_root:
+            return bytes(_parse_tag(self, 0)[2])
 
     @cached_property
-    def is_index(self) -> bool:
-        return bool(self.flags & PAGE_FLAG.Index)
+    def tag_array(self) -> tuple[int, ...]:
+        """Return the raw size and offset words of all tags, as a flat tuple.
 
-    @cached_property
-    def is_long_value(self) -> bool:
-        return bool(self.flags & PAGE_FLAG.LongValue)
+        The tag array is at the end of the page and grows backwards, so the first tag is at the end of the tuple.
+        """
+        # Don't trust the tag count of corrupt pages, only unpack the tags that fit in the page
+        tag_count = min(self.tag_count, len(self.buf) // 4)
+        return struct.unpack_from(f"<{tag_count * 2}H", self.buf, len(self.buf) - tag_count * 4)
 
     @cached_property
-    def is_branch(self) -> bool:
-        return not self.is_leaf
+    def keys(self) -> list[bytes]:
+        """Return a list of the keys of all nodes.
 
-    @cached_property
-    def key_prefix(self) -> Optional[bytes]:
-        if not self.is_root:
-            return bytes(self.tag(0).data)
+        Only the keys are parsed, in a single pass over the tags. This allows for searching the page without
+        constructing any tag or node objects.
+        """
+        keys = []
+        for num in range(1, self.tag_count):
+            _, _, data, flags = _parse_tag(self, num)
+            key_prefix, key_suffix, _ = _parse_key(self, data, flags)
+            keys.append(key_prefix + key_suffix)
+        return keys
 
     def tag(self, num: int) -> Tag:
         """Retrieve a tag by index.
@@ -115,13 +131,14 @@ class Page:
         Raises:
             IndexError: If the node number is out of bounds.
         """
-        if num < 0 or num > self.node_count - 1:
+        if not 0 <= num < self.node_count:
             raise IndexError(f"Node number exceeds boundaries: 0-{self.node_count - 1}")
 
-        if num not in self._node_cache:
-            self._node_cache[num] = self._node_cls(self.tag(num + 1))
+        node = self._node_cache[num]
+        if node is None:
+            node = self._node_cache[num] = self._node_cls(self.tag(num + 1))
 
-        return self._node_cache[num]
+        return node
 
     def nodes(self) -> Iterator[Union[BranchNode, LeafNode]]:
         """Yield all nodes."""
@@ -140,20 +157,35 @@ class Page:
         For this reason, we actually explicitly check if the last page we parse has a ``next_page`` attribute,
         and also parse that. This methods seems to work so far.
         """
+        if self.is_leaf:
+            yield from self.nodes()
+            return
+
         esedb = self.esedb
         leaf = None
 
-        for node in self.nodes():
-            if self.is_leaf:
-                yield node
-            else:
+        # Traverse the branches depth first, keeping a stack of the node iterators of the branch pages
+        # Branches of corrupt databases can point back to pages we already visited, so skip those
+        seen = {self.num}
+        stack = [self.nodes()]
+        while stack:
+            for node in stack[-1]:
+                if node.child in seen:
+                    continue
+                seen.add(node.child)
+
                 child = esedb.page(node.child)
-                for leaf in child.iter_leaf_nodes():
-                    yield leaf
+                if child.is_leaf:
+                    for leaf in child.nodes():
+                        yield leaf
+                else:
+                    stack.append(child.nodes())
+                    break
+            else:
+                stack.pop()
 
-        if self.is_root and leaf and leaf.tag.page.next_page:
-            for leaf in esedb.page(leaf.tag.page.next_page).iter_leaf_nodes():
-                yield leaf
+        if self.is_root and leaf and leaf.tag.page.next_page and leaf.tag.page.next_page not in seen:
+            yield from esedb.page(leaf.tag.page.next_page).iter_leaf_nodes()
 
     def __repr__(self) -> str:
         return f"<Page num={self.num:d}>"
@@ -167,40 +199,61 @@ class Tag:
         num: The tag number to parse.
     """
 
-    __slots__ = ("page", "num", "tag", "offset", "size", "data", "flags")
+    __slots__ = ("page", "num", "offset", "size", "data", "_flags")
 
     def __init__(self, page: Page, num: int):
         self.page = page
         self.num = num
 
-        tag_offset = len(page.buf) + ((num + 1) * -4)
-        tag_buf = page.buf[tag_offset : tag_offset + 4]
+        self.offset, self.size, self.data, self._flags = _parse_tag(page, num)
 
-        self.tag = c_esedb.TAG(tag_buf)
+    @property
+    def tag(self) -> c_esedb.TAG:
+        """Return the parsed ``TAG`` structure of this tag."""
+        tag_offset = len(self.page.buf) + ((self.num + 1) * -4)
+        return c_esedb.TAG(self.page.buf[tag_offset : tag_offset + 4])
 
-        mask = 0x1FFF if page.is_small_page else 0x7FFF
-        self.size = self.tag.cb_ & mask
-        self.offset = self.tag.ib_ & mask
+    @property
+    def flags(self) -> TAG_FLAG:
+        """Return the flags of this tag."""
+        return TAG_FLAG(self._flags)
 
-        if self.size == 0 and self.num != 0:
-            raise ValueError("Invalid TAG data, corrupt database?")
+    def __repr__(self) -> str:
+        return f"<Tag offset=0x{self.offset:x} size=0x{self.size:x}>"
 
-        self.data = self.page.data[self.offset : self.offset + self.size]
 
-        flags = 0
-        if page.is_small_page:
-            # Small pages have the flag in the tag
-            flags = self.tag.ib_ >> 13
-        elif len(self.data) >= 2:
-            # Large pages have the flag in the first USHORT
-            # Also in the 3 MSB, just like the small page, but we know it'll be little endian so do a shortcut on
-            # the second byte.
-            flags = self.data[1] >> 5
+def _parse_tag(page: Page, num: int) -> tuple[int, int, memoryview, int]:
+    """Parse a tag from the given page.
 
-        self.flags = TAG_FLAG(flags)
+    Returns:
+        A tuple of the offset, size, data and flags of the tag.
+    """
+    # Each tag is a TAG structure (cb_ and ib_), indexed from the end of the tag array
+    tag_array = page.tag_array
+    cb = tag_array[-2 * num - 2]
+    ib = tag_array[-2 * num - 1]
 
-    def __repr__(self) -> str:
-        return f"<Tag offset=0x{self.offset:x} size=0x{self.size:x}>"
+    small_page = page.is_small_page
+    mask = 0x1FFF if small_page else 0x7FFF
+    size = cb & mask
+    offset = ib & mask
+
+    if size == 0 and num != 0:
+        raise ValueError("Invalid TAG data, corrupt database?")
+
+    data = page.data[offset : offset + size]
+
+    flags = 0
+    if small_page:
+        # Small pages have the flag in the tag
+        flags = ib >> 13
+    elif len(data) >= 2:
+        # Large pages have the flag in the first USHORT
+        # Also in the 3 MSB, just like the small page, but we know it'll be little endian so do a shortcut on
+        # the second byte.
+        flags = data[1] >> 5
+
+    return offset, size, data, flags
 
 
 class Node:
@@ -216,32 +269,42 @@ class Node:
         self.tag = tag
         self.num = tag.num - 1
 
-        buf = tag.data
-        offset = 0
+        key_prefix, key_suffix, offset = _parse_key(tag.page, tag.data, tag._flags)
 
-        key_prefix = b""
-        key_prefix_size = None
+        self.key = key_prefix + key_suffix
+        self.key_prefix = key_prefix
+        self.key_suffix = key_suffix
+        self.data = tag.data[offset:]
 
-        # Large pages have the tag flags encoded in the 3 MSB of the first word, so we have to mask the first 13 bits
-        # See also the Tag class
-        if len(buf) >= offset + 2 and tag.flags & TAG_FLAG.Compressed:
-            key_prefix_size = struct.unpack("<H", buf[:2])[0] & 0x1FFF
-            key_prefix = self.tag.page.key_prefix[:key_prefix_size].ljust(key_prefix_size, b"\x00")
-            offset += 2
 
-        key_suffix = b""
-        key_suffix_size = None
+def _parse_key(page: Page, buf: memoryview, flags: int) -> tuple[bytes, bytes, int]:
+    """Parse the key of a node from the given tag data and flags.
 
-        if len(buf) >= offset + 2:
-            key_suffix_size = struct.unpack("<H", buf[offset : offset + 2])[0] & 0x1FFF
-            offset += 2
-            key_suffix = buf[offset : offset + key_suffix_size]
-            offset += key_suffix_size
+    Returns:
+        A tuple of the key prefix, the key suffix and the offset of the node data.
+    """
+    offset = 0
 
-        self.key = key_prefix + key_suffix
-        self.key_prefix = key_prefix
-        self.key_suffix = key_suffix
-        self.data = buf[offset:]
+    key_prefix = b""
+    key_prefix_size = None
+
+    # Large pages have the tag flags encoded in the 3 MSB of the first word, so we have to mask the first 13 bits
+    # See also the Tag class
+    if len(buf) >= offset + 2 and flags & TAG_FLAG_COMPRESSED:
+        key_prefix_size = _unpack_uint16(buf, 0)[0] & 0x1FFF
+        key_prefix = page.key_prefix[:key_prefix_size].ljust(key_prefix_size, b"\x00")
+        offset += 2
+
+    key_suffix = b""
+    key_suffix_size = None
+
+    if len(buf) >= offset + 2:
+        key_suffix_size = _unpack_uint16(buf, offset)[0] & 0x1FFF
+        offset += 2
+        key_suffix = buf[offset : offset + key_suffix_size]
+        offset += key_suffix_size
+
+    return key_prefix, key_suffix, offset
 
 
 class LeafNode(Node):
@@ -258,7 +321,7 @@ class BranchNode(Node):
 
     def __init__(self, tag: Tag):
         super().__init__(tag)
-        self.child = struct.unpack("<I", self.data[:4])[0]
+        self.child = _unpack_uint32(self.data, 0)[0]
 
     def __repr__(self) -> str:
         return f"<BranchNode key={self.key} child={self.child}>"
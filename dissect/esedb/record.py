@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import functools
 import struct
 from binascii import hexlify
 from functools import lru_cache
@@ -9,13 +8,25 @@ from typing import TYPE_CHECKING, Any, Iterator, Optional
 from dissect.util.xmemoryview import xmemoryview
 
 from dissect.esedb import compression
-from dissect.esedb.c_esedb import PAGE_FLAG, TAGFLD_HEADER, RecordValue, c_esedb
+from dissect.esedb.c_esedb import (
+    TAGFLD_HEADER,
+    TAGFLD_HEADER_COMPRESSED,
+    TAGFLD_HEADER_MULTI_VALUES,
+    TAGFLD_HEADER_NULL,
+    TAGFLD_HEADER_SEPARATED,
+    TAGFLD_HEADER_TWO_VALUES,
+    RecordValue,
+    c_esedb,
+)
 
 if TYPE_CHECKING:
     from dissect.esedb.page import Node
     from dissect.esedb.table import Column, Table
 
 
+_unpack_uint16 = struct.Struct("<H").unpack_from
+
+
 def noop(value: Any):
     return value
 
@@ -137,7 +148,7 @@ class RecordData:
                 self._tagged_data_start += self._variable_offsets[-1] & 0x7FFF
 
             if len(self.data) >= self._tagged_data_start + 4:
-                if node.tag.page.flags & PAGE_FLAG.NewRecordFormat == 0:
+                if not node.tag.page.is_new_record_format:
                     raise NotImplementedError("Record has tagged fields in an old format, which is not implemented yet")
 
                 tag_value = int.from_bytes(self.data[self._tagged_data_start : self._tagged_data_start + 4], "little")
@@ -219,15 +230,12 @@ class RecordData:
 
         For tagged columns, also interpret things like multi-values, separated and compressed data.
         """
-        ctype = column.ctype
-        parse_func = ctype.parse
-        if column.is_text:
-            parse_func = functools.partial(ctype.parse, encoding=column.encoding)
+        parse_func = column.parse_func
 
         if self.esedb.impacket_compat:
-            if tag_field and tag_field.flags & TAGFLD_HEADER.Compressed:
+            if tag_field and tag_field._flags & TAGFLD_HEADER_COMPRESSED:
                 value = None
-            elif tag_field and tag_field.flags & TAGFLD_HEADER.MultiValues:
+            elif tag_field and tag_field._flags & TAGFLD_HEADER_MULTI_VALUES:
                 value = hexlify(value)
             elif parse_func != bytes:
                 value = parse_func(value)
@@ -235,17 +243,17 @@ class RecordData:
                 value = hexlify(value)
         else:
             if tag_field:
-                if tag_field.flags & TAGFLD_HEADER.MultiValues:
+                if tag_field._flags & TAGFLD_HEADER_MULTI_VALUES:
                     value = self._parse_multivalue(value, tag_field)
                 else:
-                    if tag_field.flags & TAGFLD_HEADER.Separated:
+                    if tag_field._flags & TAGFLD_HEADER_SEPARATED:
                         value = self.table.get_long_value(bytes(value))
-                    elif tag_field.flags & TAGFLD_HEADER.Compressed:
+                    elif tag_field._flags & TAGFLD_HEADER_COMPRESSED:
                         # Long values are already decompressed during retrieval
                         value = compression.decompress(value)
 
             parse_func = parse_func or noop
-            if tag_field and tag_field.flags & TAGFLD_HEADER.MultiValues:
+            if tag_field and tag_field._flags & TAGFLD_HEADER_MULTI_VALUES:
                 value = list(map(parse_func, value))
             else:
                 value = parse_func(value)
@@ -255,17 +263,17 @@ class RecordData:
     def _parse_multivalue(self, value: bytes, tag_field: TagField):
         fSeparatedInstance = 0x8000
 
-        if tag_field.flags & TAGFLD_HEADER.TwoValues:
+        if tag_field._flags & TAGFLD_HEADER_TWO_VALUES:
             # Optimized storage for when a multi-value only has two values
             # First byte is the size of the first value, calculate the size of the second value from that
             first_size = value[0]
             second_size = len(value) - (1 + first_size)
             value = [value[1 : 1 + first_size], value[1 + first_size : 1 + first_size + second_size]]
-        elif tag_field.flags & TAGFLD_HEADER.MultiValues:
+        elif tag_field._flags & TAGFLD_HEADER_MULTI_VALUES:
             # Regular multi-value storage, starts with an array of USHORT offsets to the actual values
             # Just calculate the amount of values from the first entry
             # Individual offsets can have a fSeparatedInstance (0x8000) flag set
-            first_value_offset = struct.unpack("<H", value[0:2])[0] & 0x7FFF
+            first_value_offset = _unpack_uint16(value)[0] & 0x7FFF
             num_values = first_value_offset // 2  # sizeof(USHORT)
             value_offsets = struct.unpack(f"<{num_values}H", value[:first_value_offset]) + (len(value),)
 
@@ -278,7 +286,7 @@ class RecordData:
                 values.append(data)
             value = values
 
-        if tag_field.flags & TAGFLD_HEADER.Compressed:
+        if tag_field._flags & TAGFLD_HEADER_COMPRESSED:
             # Only the first entry appears to be compressed
             value[0] = compression.decompress(value[0])
 
@@ -413,7 +421,7 @@ class RecordData:
 class TagField:
     """Represents a ``TAGFLD``, which contains information about a tagged field in a record."""
 
-    __slots__ = ("record", "identifier", "_offset", "offset", "has_extended_info", "flags")
+    __slots__ = ("record", "identifier", "_offset", "offset", "has_extended_info", "_flags")
 
     fNullSmallPage = 0x2000
     fDerived = 0x8000
@@ -431,20 +439,25 @@ class TagField:
             self.has_extended_info = True
 
         if self.has_extended_info and len(self.record.data) >= self.record._tagged_data_start + self.offset:
-            self.flags = TAGFLD_HEADER(self.record.data[self.record._tagged_data_start + self.offset])
+            self._flags = self.record.data[self.record._tagged_data_start + self.offset]
         else:
-            self.flags = TAGFLD_HEADER.Invalid  # Made up flag member to keep the types consistent
+            self._flags = TAGFLD_HEADER.Invalid.value  # Made up flag member to keep the types consistent
 
     def __repr__(self) -> str:
         return f"<TagField identifier={self.identifier} offset={self.offset:#x} flags={str(self.flags).split('.')[1]}>"
 
+    @property
+    def flags(self) -> TAGFLD_HEADER:
+        """Return the flags of this tagged field."""
+        return TAGFLD_HEADER(self._flags)
+
     @property
     def is_null(self) -> bool:
         """Return whether this tagged field is null."""
         if self.record.esedb.has_small_pages:
             return bool(self._offset & TagField.fNullSmallPage)
         else:
-            return bool(self.flags & TAGFLD_HEADER.Null)
+            return bool(self._flags & TAGFLD_HEADER_NULL)
 
     @property
     def is_derived(self) -> bool:
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import struct
-from functools import cached_property
-from typing import TYPE_CHECKING, Any, Iterator, Optional
+from functools import cached_property, partial
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional
 
 from dissect.esedb import compression
 from dissect.esedb.c_esedb import (
@@ -11,9 +11,10 @@ from dissect.esedb.c_esedb import (
     SYSOBJ,
     ColumnType,
     JET_coltyp,
+    RecordValue,
 )
 from dissect.esedb.cursor import Cursor
-from dissect.esedb.exceptions import NoNeighbourPageError
+from dissect.esedb.exceptions import KeyNotFoundError
 from dissect.esedb.index import Index
 from dissect.esedb.page import Page
 from dissect.esedb.record import Record
@@ -21,6 +22,9 @@ from dissect.esedb.record import Record
 if TYPE_CHECKING:
     from dissect.esedb.esedb import EseDB
 
+_unpack_lv_header = struct.Struct("<2I").unpack_from
+_unpack_lv_chunk_offset = struct.Struct(">I").unpack_from
+
 
 class Table:
     """Represents a table in an ESE database.
@@ -139,23 +143,23 @@ class Table:
         """
         rkey = key[::-1]
         cursor = Cursor(self.esedb, self.lv_page)
-        header = cursor.search(rkey)
+        nodes = cursor.scan_from(rkey)
+
+        header = next(nodes)
+        if header.key != rkey:
+            raise KeyNotFoundError(f"Can't find key: {rkey}")
 
-        _, size = struct.unpack("<2I", header.data)
+        _, size = _unpack_lv_header(header.data)
         chunks = []
         chunk_offsets = []
 
-        while True:
-            try:
-                node = cursor.next()
-                if not node.key.startswith(rkey):
-                    break
-            except NoNeighbourPageError:
+        for node in nodes:
+            if not node.key.startswith(rkey):
                 break
 
             chunks.append(node.data)
 
-            chunk_offset = struct.unpack(">I", node.key[-4:])[0]
+            chunk_offset = _unpack_lv_chunk_offset(node.key, len(node.key) - 4)[0]
             chunk_offsets.append(chunk_offset)
 
         chunk_offsets.append(size)
@@ -246,6 +250,16 @@ class Column:
     def ctype(self) -> ColumnType:
         return COLUMN_TYPE_MAP[self.type.value]
 
+    @cached_property
+    def parse_func(self) -> Optional[Callable[[bytes], RecordValue]]:
+        """Return the function to parse raw values of this column with.
+
+        Text columns are bound to the encoding of the column.
+        """
+        if self.is_text:
+            return partial(self.ctype.parse, encoding=self.encoding)
+        return self.ctype.parse
+
     def __repr__(self) -> str:
         return f"<Column name={self.name} identifier=0x{self.identifier:x} type={self.type} size={self.size}>"
 
@@ -0,0 +1,16 @@
+import pytest
+
+from dissect.esedb.compression import decompress, decompress_size
+
+
+def test_decompress_size():
+    assert decompress_size(b"\x00uncompressed") is None
+    assert decompress_size(b"\x18\x39\x05\x00\x00") == 0x539
+
+    with pytest.raises(NotImplementedError):
+        decompress_size(b"\x28\x00\x00")
+
+
+def test_decompress_uncompressed():
+    buf = b"\x00uncompressed"
+    assert decompress(buf) is buf
@@ -0,0 +1,26 @@
+from typing import BinaryIO
+
+from dissect.esedb.cursor import Cursor
+from dissect.esedb.esedb import EseDB
+
+
+def test_scan_from(large_db: BinaryIO):
+    db = EseDB(large_db)
+    table = db.table("large")
+    keys = [node.key for node in table.root.iter_leaf_nodes()]
+
+    cursor = Cursor(db, table.root)
+
+    # The records in this table are large enough to have a leaf page each
+    nodes = list(cursor.scan_from(keys[0]))
+    assert [node.key for node in nodes] == keys
+    assert len({node.tag.page.num for node in nodes}) == len(keys)
+
+    # Without an exact match, the scan starts at the node the search ends on
+    nodes = cursor.scan_from(keys[0] + b"\x00")
+    assert next(nodes).key == keys[0]
+    assert next(nodes).key == keys[1]
+
+    # The position of the cursor is not changed
+    assert cursor.node().tag.page.num == table.root.num
+    assert cursor.node().num == 0
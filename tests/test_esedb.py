@@ -1,8 +1,10 @@
 import datetime
+import shutil
 
+import pytest
 from dissect.util.ts import oatimestamp
 
-from dissect.esedb.c_esedb import JET_coltyp
+from dissect.esedb.c_esedb import JET_coltyp, checksum_xor
 from dissect.esedb.esedb import EseDB
 
 
@@ -348,3 +350,55 @@ def test_large_db(large_db):
 
     for i in range(64993):
         assert records[i // 4096].get(f"Column{i}") == i
+
+
+def test_regular_file(basic_db, tmp_path):
+    path = tmp_path / "basic.edb"
+    with path.open("wb") as fh:
+        shutil.copyfileobj(basic_db, fh)
+
+    with path.open("rb") as fh:
+        db = EseDB(fh)
+        offset = fh.tell()
+
+        records = list(db.table("basic").records())
+        assert len(records) == 2
+        assert records[0].Id == 1
+        assert records[1].Id == 2
+
+        # Pages are read without moving the file position
+        assert fh.tell() == offset
+
+    # No resources are kept alive after closing the file
+    with pytest.raises(ValueError):
+        db.read_page(3)
+    path.unlink()
+
+
+def test_checksum_xor(basic_db):
+    db = EseDB(basic_db)
+
+    basic_db.seek(0)
+    buf = basic_db.read(db.page_size)
+    assert checksum_xor(buf[4:]) == db.header.ulChecksum
+
+    assert checksum_xor(b"") == 0x89ABCDEF
+    assert checksum_xor(b"\x01\x00\x00\x00\x02\x00\x00\x00\x04\x00\x00\x00", initial=0) == 7
+
+
+def test_pages(basic_db):
+    db = EseDB(basic_db)
+    cache_size = db.page.cache_info().currsize
+
+    pages = list(db.pages())
+    assert [page.num for page in pages] == list(range(1, len(pages) + 1))
+    assert db.page.cache_info().currsize == cache_size
+
+
+def test_tag(basic_db):
+    db = EseDB(basic_db)
+    tag = db.table("basic").root.node(0).tag
+
+    # Small pages (<= 8K) use the lower 13 bits for the size and offset
+    assert tag.tag.cb_ & 0x1FFF == tag.size
+    assert tag.tag.ib_ & 0x1FFF == tag.offset
@@ -73,6 +73,8 @@ def test_index(index_db):
 
     assert table.indexes[16].name == "IxUnicode"
     assert table.indexes[16].column_ids == [130]
+    assert table.indexes[16].lcmap_flags == 0x30401
+    assert table.indexes[16].locale == "en-US"
     assert table.indexes[16].search(Unicode="Simple Unicode text 🦊")
 
     assert table.indexes[17].name == "IxLongASCII"
@@ -0,0 +1,8 @@
+from dissect.esedb.lcmapstring import MapFlags, map_string
+
+
+def test_map_string_stacked_nonspace_marks():
+    # The diacritic weights of stacked nonspacing marks add up beyond a single byte, which is fine if they're ignored
+    flags = MapFlags.LCMAP_SORTKEY | MapFlags.NORM_IGNORECASE | MapFlags.NORM_IGNORENONSPACE
+    flags |= MapFlags.NORM_IGNOREKANATYPE | MapFlags.NORM_IGNOREWIDTH
+    assert map_string("a" + "᷊" * 3, flags, "en-US") == bytes.fromhex("0e020100010001000101010100")
@@ -0,0 +1,55 @@
+import struct
+from typing import BinaryIO
+
+from dissect.esedb.c_esedb import c_esedb
+from dissect.esedb.esedb import EseDB
+from dissect.esedb.page import Page
+
+
+def _branch_page(db: EseDB, num: int, page: Page, children: list[int]) -> Page:
+    """Create a branch page from a copy of ``page`` that only has nodes pointing to the given children."""
+    buf = bytearray(page.buf)
+
+    header = c_esedb.PGHDR(buf)
+    header.itagMicFree = len(children) + 1
+    buf[: len(c_esedb.PGHDR)] = header.dumps()
+
+    data_start = len(c_esedb.PGHDR) + (0 if page.is_small_page else len(c_esedb.PGHDR2))
+    for node, child in zip(page.nodes(), children):
+        struct.pack_into("<I", buf, data_start + node.tag.offset + node.tag.size - len(node.data), child)
+
+    return Page(db, num, bytes(buf))
+
+
+def test_iter_leaf_nodes_branch_of_branches(large_db: BinaryIO):
+    db = EseDB(large_db)
+    root = db.table("large").root
+    leaf_pages = [node.child for node in root.nodes()]
+    leaf_nodes = [(node.tag.page.num, node.key) for node in root.iter_leaf_nodes()]
+
+    # None of the test databases have more than two levels, so build a third one on top of the large table
+    pages = {
+        1001: _branch_page(db, 1001, root, leaf_pages[:8]),
+        1002: _branch_page(db, 1002, root, leaf_pages[8:]),
+    }
+    top = _branch_page(db, 1000, root, [1001, 1002])
+    assert pages[1001].node_count == pages[1002].node_count == 8
+
+    page = db.page
+    db.page = lambda num: pages[num] if num in pages else page(num)
+
+    assert [(node.tag.page.num, node.key) for node in top.iter_leaf_nodes()] == leaf_nodes
+
+
+def test_iter_leaf_nodes_cycle(large_db: BinaryIO):
+    db = EseDB(large_db)
+    root = db.table("large").root
+    leaf_pages = [node.child for node in root.nodes()]
+    leaf_nodes = [(node.tag.page.num, node.key) for node in root.iter_leaf_nodes()]
+
+    # A corrupt branch that points back to the root page is skipped, instead of walking it again
+    page = db.page
+    db.page = lambda num: root if num == leaf_pages[2] else page(num)
+
+    nodes = [(node.tag.page.num, node.key) for node in root.iter_leaf_nodes()]
+    assert nodes == [node for node in leaf_nodes if node[0] != leaf_pages[2]]